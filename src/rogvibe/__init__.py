@@ -2,7 +2,9 @@
 
 from __future__ import annotations
 
-from .app import DEFAULT_PARTICIPANTS, LotteryApp, SlotMachineApp, run, run_slot_machine
+from typing import Any
+
+from .app import LotteryApp, SlotMachineApp, run, run_slot_machine
 from .models import SpinFinished, SpinTick
 from .widgets import LotteryWheel
 
@@ -16,3 +18,12 @@ __all__ = [
     "run",
     "run_slot_machine",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    # `DEFAULT_PARTICIPANTS` is detected on first access, see `app.py`.
+    if name == "DEFAULT_PARTICIPANTS":
+        from . import app
+
+        return app.get_default_participants()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
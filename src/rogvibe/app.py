@@ -2,32 +2,54 @@
 
 from __future__ import annotations
 
-from typing import Iterable
+from typing import Any, Iterable
 
 from .apps import FlipCardApp, LotteryApp, SlotMachineApp
 from .constants import FALLBACK_DEFAULTS
 from .utils import detect_default_participants
 
-# Prefer detected providers, otherwise fall back to sample names.
-DEFAULT_PARTICIPANTS: list[str] = detect_default_participants() or FALLBACK_DEFAULTS
+# Detected lazily on first use so importing rogvibe does not scan PATH.
+_default_participants: list[str] | None = None
 
 __all__ = [
     "run",
     "run_slot_machine",
     "run_flip_card",
+    "get_default_participants",
     "LotteryApp",
     "SlotMachineApp",
     "FlipCardApp",
-    "DEFAULT_PARTICIPANTS",
 ]
 
 
+def _compute_default_participants() -> list[str]:
+    """Detect providers on PATH, otherwise fall back to sample names."""
+    return detect_default_participants() or list(FALLBACK_DEFAULTS)
+
+
+def get_default_participants() -> list[str]:
+    """Return the default participants, detecting them on first use."""
+    global _default_participants
+    if _default_participants is None:
+        _default_participants = _compute_default_participants()
+    return _default_participants
+
+
+def __getattr__(name: str) -> Any:
+    # Keep `DEFAULT_PARTICIPANTS` importable while computing it on first access.
+    if name == "DEFAULT_PARTICIPANTS":
+        return get_default_participants()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
 def run(participants: Iterable[str] | None = None) -> None:
     """Launch the Textual app with the provided participants."""
     normalized = (
-        [name.strip() for name in participants if name.strip()] if participants else []
+        [stripped for name in participants if (stripped := name.strip())]
+        if participants
+        else []
     )
-    names = normalized or list(DEFAULT_PARTICIPANTS)
+    names = normalized or list(get_default_participants())
     app = LotteryApp(names)
     app.run()
 
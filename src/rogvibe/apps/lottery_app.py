@@ -10,7 +10,7 @@ from textual.containers import Vertical
 from textual.widgets import Footer, Static
 
 from ..constants import SPECIAL_PARTICIPANTS
-from ..models.messages import SpinFinished, SpinTick
+from ..models.messages import SpinFinished
 from ..utils.executor import execute_command
 from ..widgets.lottery_wheel import LotteryWheel
 
@@ -57,9 +57,11 @@ class LotteryApp(App):
 
     def __init__(self, participants: Sequence[str]) -> None:
         super().__init__()
-        self._participants = list(participants)
+        self._participants = tuple(participants)
         self._wheel = LotteryWheel(self._participants)
         self._result = Static(id="result")
+        # Let the wheel show dice faces directly instead of posting SpinTick
+        self._wheel.result_static = self._result
         self._pending_command: str | None = None
         self._celebration_timer: Any | None = None
         self._celebration_frame = 0
@@ -97,12 +99,6 @@ class LotteryApp(App):
             self._result.update("🎲 Spinning...")
             self._wheel.start_spin()
 
-    def on_spin_tick(self, message: SpinTick) -> None:
-        """Update the spinning message with animated dice."""
-        dice_emoji_map = {"⚀": "⚀", "⚁": "⚁", "⚂": "⚂", "⚃": "⚃", "⚄": "⚄", "⚅": "⚅"}
-        dice_display = dice_emoji_map.get(message.dice_face, "🎲")
-        self._result.update(f"{dice_display} Spinning...")
-
     def _animate_celebration(self) -> None:
         """Animate celebration for lucky/handy/claude winners."""
         from ..constants import BORDER_COLORS, CELEBRATION_EMOJIS, ANIMATION_COLORS
@@ -2,7 +2,6 @@
 
 from __future__ import annotations
 
-from collections import Counter
 from typing import Any
 
 from rich.text import Text
@@ -200,11 +199,11 @@ class SlotMachineApp(App):
     def on_slot_all_stopped(self, message: SlotAllStopped) -> None:
         """Handle all reels stopped."""
         results = message.results
-        # Count occurrences of each result
-        counts = Counter(results)
+        # Three reels, so matches can be found by comparing them directly
+        first, second, third = results
         # Check if all three are the same - JACKPOT!
-        if len(set(results)) == 1:
-            winner = results[0]
+        if first == second == third:
+            winner = first
             self._pending_command = winner
             # Highlight all reels with yellow color for JACKPOT
             for reel in self._slot_machine._reels:
@@ -217,9 +216,9 @@ class SlotMachineApp(App):
                 f"↩️  Press Enter to run '{winner}' and exit, or q to quit."
             )
         # Check if two are the same
-        elif max(counts.values()) == 2:
+        elif first == second or first == third or second == third:
             # Find the value that appears twice
-            winner = [item for item, count in counts.items() if count == 2][0]
+            winner = first if first in (second, third) else second
             self._pending_command = winner
             # Highlight matching reels
             for i, reel in enumerate(self._slot_machine._reels):
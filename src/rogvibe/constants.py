@@ -3,16 +3,16 @@
 from __future__ import annotations
 
 # Fallback participant names
-FALLBACK_DEFAULTS: list[str] = [
+FALLBACK_DEFAULTS: tuple[str, ...] = (
     "handy",
     "handy",
     "handy",
     "handy",
-]
+)
 
 # List of potential viber commands to detect on the system
 # add more here PR welcome
-MAYBE_VIBER: list[str] = [
+MAYBE_VIBER: tuple[str, ...] = (
     "kimi",
     "claude",
     "gemini",
@@ -21,17 +21,26 @@ MAYBE_VIBER: list[str] = [
     "cursor",
     "amp",
     "opencode",
-]
+)
 
 # Animation settings
-ANIMATION_COLORS: list[str] = ["yellow", "red", "magenta", "cyan", "white"]
-BORDER_COLORS: list[str] = ["yellow", "red", "magenta", "cyan", "green"]
-CELEBRATION_EMOJIS: list[str] = ["✨", "🌟", "⭐", "💫", "🎉", "🎊", "🎈"]
+ANIMATION_COLORS: tuple[str, ...] = ("yellow", "red", "magenta", "cyan", "white")
+BORDER_COLORS: tuple[str, ...] = ("yellow", "red", "magenta", "cyan", "green")
+CELEBRATION_EMOJIS: tuple[str, ...] = ("✨", "🌟", "⭐", "💫", "🎉", "🎊", "🎈")
+
+# Spin animation timing (seconds)
+SPIN_FRAME_INTERVAL: float = 1 / 30
+
+
+def frames_for_delay(delay: float) -> int:
+    """Number of frames to idle so that a step lands roughly every `delay` seconds."""
+    return max(0, round(delay / SPIN_FRAME_INTERVAL) - 1)
+
 
 # Dice faces
-DICE_FACES: list[str] = ["⚀", "⚁", "⚂", "⚃", "⚄", "⚅"]
+DICE_FACES: tuple[str, ...] = ("⚀", "⚁", "⚂", "⚃", "⚄", "⚅")
 DICE_EMOJI: str = "🎲"
 TARGET_EMOJI: str = "🎯"
 
 # Special participants
-SPECIAL_PARTICIPANTS: set[str] = {"lucky", "handy"}
+SPECIAL_PARTICIPANTS: frozenset[str] = frozenset({"lucky", "handy"})
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 from .messages import (
+    OriginMessage,
     SlotAllStopped,
     SlotReelSpinning,
     SlotReelStopped,
@@ -11,6 +12,7 @@ from .messages import (
 )
 
 __all__ = [
+    "OriginMessage",
     "SpinFinished",
     "SpinTick",
     "SlotReelSpinning",
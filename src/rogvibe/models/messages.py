@@ -2,20 +2,28 @@
 
 from __future__ import annotations
 
+import inspect
+
 from textual.message import Message
 from textual.widget import Widget
 
+# Textual <=0.43 expects the sender argument; newer versions no longer take it.
+# The signature can't change at runtime, so probe it once instead of per message.
+try:
+    _MSG_TAKES_SENDER = "sender" in inspect.signature(Message.__init__).parameters
+except (TypeError, ValueError):
+    _MSG_TAKES_SENDER = False
 
-class SpinFinished(Message):
-    """Fired when the wheel stops spinning."""
 
-    def __init__(self, sender: Widget, winner: str) -> None:
-        try:
-            super().__init__(sender)  # type: ignore[arg-type]  # Textual <=0.43 expects the sender argument.
-        except TypeError:
-            super().__init__()  # Newer Textual versions no longer take sender.
+class OriginMessage(Message):
+    """Base for messages that remember the widget which emitted them."""
+
+    def __init__(self, sender: Widget) -> None:
+        if _MSG_TAKES_SENDER:
+            super().__init__(sender)  # type: ignore[arg-type]
+        else:
+            super().__init__()
         self._origin = sender
-        self.winner = winner
 
     @property
     def origin(self) -> Widget:
@@ -23,105 +31,59 @@ class SpinFinished(Message):
         return self._origin
 
 
-class SpinTick(Message):
-    """Fired each time the wheel advances during spinning."""
+class SpinFinished(OriginMessage):
+    """Fired when the wheel stops spinning."""
+
+    def __init__(self, sender: Widget, winner: str) -> None:
+        super().__init__(sender)
+        self.winner = winner
+
+
+class SpinTick(OriginMessage):
+    """Fired when the wheel advances onto a new dice face during spinning."""
 
     def __init__(self, sender: Widget, dice_face: str) -> None:
-        try:
-            super().__init__(sender)  # type: ignore[arg-type]
-        except TypeError:
-            super().__init__()
-        self._origin = sender
+        super().__init__(sender)
         self.dice_face = dice_face
 
-    @property
-    def origin(self) -> Widget:
-        """Widget that emitted the message."""
-        return self._origin
 
-
-class SlotReelSpinning(Message):
+class SlotReelSpinning(OriginMessage):
     """Fired when a reel is spinning."""
 
     def __init__(self, sender: Widget, reel_index: int, value: str) -> None:
-        try:
-            super().__init__(sender)  # type: ignore[arg-type]
-        except TypeError:
-            super().__init__()
-        self._origin = sender
+        super().__init__(sender)
         self.reel_index = reel_index
         self.value = value
 
-    @property
-    def origin(self) -> Widget:
-        """Widget that emitted the message."""
-        return self._origin
 
-
-class SlotReelStopped(Message):
+class SlotReelStopped(OriginMessage):
     """Fired when a reel stops spinning."""
 
     def __init__(self, sender: Widget, reel_index: int, value: str) -> None:
-        try:
-            super().__init__(sender)  # type: ignore[arg-type]
-        except TypeError:
-            super().__init__()
-        self._origin = sender
+        super().__init__(sender)
         self.reel_index = reel_index
         self.value = value
 
-    @property
-    def origin(self) -> Widget:
-        """Widget that emitted the message."""
-        return self._origin
-
 
-class SlotAllStopped(Message):
+class SlotAllStopped(OriginMessage):
     """Fired when all reels have stopped."""
 
     def __init__(self, sender: Widget, results: list[str]) -> None:
-        try:
-            super().__init__(sender)  # type: ignore[arg-type]
-        except TypeError:
-            super().__init__()
-        self._origin = sender
+        super().__init__(sender)
         self.results = results
 
-    @property
-    def origin(self) -> Widget:
-        """Widget that emitted the message."""
-        return self._origin
-
 
-class AllCardsMatched(Message):
+class AllCardsMatched(OriginMessage):
     """Fired when all cards are matched in the flip card game."""
 
     def __init__(self, sender: Widget, winner: str) -> None:
-        try:
-            super().__init__(sender)  # type: ignore[arg-type]
-        except TypeError:
-            super().__init__()
-        self._origin = sender
+        super().__init__(sender)
         self.winner = winner
 
-    @property
-    def origin(self) -> Widget:
-        """Widget that emitted the message."""
-        return self._origin
-
 
-class PairMatched(Message):
+class PairMatched(OriginMessage):
     """Fired when a pair of cards is matched in the flip card game."""
 
     def __init__(self, sender: Widget, value: str) -> None:
-        try:
-            super().__init__(sender)  # type: ignore[arg-type]
-        except TypeError:
-            super().__init__()
-        self._origin = sender
+        super().__init__(sender)
         self.value = value
-
-    @property
-    def origin(self) -> Widget:
-        """Widget that emitted the message."""
-        return self._origin
@@ -2,11 +2,69 @@
 
 from __future__ import annotations
 
+import logging
+import os
 import random
-import shutil
+from functools import lru_cache
 
 from ..constants import MAYBE_VIBER
 
+logger = logging.getLogger(__name__)
+
+# Names used to pad short provider lists up to a full grid
+_FILLERS: tuple[str, ...] = ("lucky", "handy")
+
+
+def _path_executables() -> frozenset[str]:
+    """Return the MAYBE_VIBER commands that are executable on the current PATH.
+
+    On Windows the names are lower-cased and PATHEXT suffixes are stripped so
+    that e.g. ``claude.cmd`` is found as ``claude``.
+    """
+    windows = os.name == "nt"
+    pathext = os.environ.get("PATHEXT", "") if windows else ""
+    return _scan_path(
+        os.environ.get("PATH", os.defpath), pathext, windows, frozenset(MAYBE_VIBER)
+    )
+
+
+@lru_cache(maxsize=8)
+def _scan_path(
+    path: str, pathext: str, windows: bool, candidates: frozenset[str]
+) -> frozenset[str]:
+    """Scan every PATH directory once; cached per PATH/PATHEXT value.
+
+    Like ``shutil.which``, a name only counts if it is a regular file and, on
+    POSIX, executable. Those checks cost a syscall, so only ``candidates`` get them.
+    """
+    exts = {ext.lower() for ext in pathext.split(os.pathsep) if ext}
+    seen: set[str] = set()
+    for directory in path.split(os.pathsep):
+        if not directory:
+            continue
+        try:
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    if windows:
+                        name, ext = os.path.splitext(entry.name.lower())
+                        if ext not in exts:
+                            continue
+                    else:
+                        name = entry.name
+                    if name not in candidates or name in seen:
+                        continue
+                    try:
+                        # is_file() follows symlinks, so dangling links are skipped
+                        if not entry.is_file():
+                            continue
+                    except OSError:
+                        continue
+                    if windows or os.access(entry.path, os.X_OK):
+                        seen.add(name)
+        except OSError:
+            continue
+    return frozenset(seen)
+
 
 def detect_default_participants() -> list[str]:
     """Detect available viber commands on the system.
@@ -15,42 +73,28 @@ def detect_default_participants() -> list[str]:
         List of detected providers, shuffled and padded to appropriate size.
         Returns empty list if none found.
     """
-    providers: list[str] = []
-
-    fillers = ["lucky", "handy"]
-
-    def on_path(cmd: str) -> bool:
-        result = shutil.which(cmd) is not None
-        print(f"DEBUG: on_path('{cmd}') -> {result}")
-        return result
-
-    for provider in MAYBE_VIBER:
-        if on_path(provider):
-            providers.append(provider)
-
-    print(f"DEBUG: Initial providers: {providers}, length: {len(providers)}")
+    executables = _path_executables()
+    # dict.fromkeys drops repeated names while keeping their order.
+    providers = [p for p in dict.fromkeys(MAYBE_VIBER) if p in executables]
+    logger.debug("Initial providers: %s, length: %d", providers, len(providers))
 
     if len(providers) == 0:
         return []
 
-    random.shuffle(providers)
-    print(f"DEBUG: After shuffle: {providers}")
-
-    if len(providers) < 4:
-        filler_index_less = 0
-        while len(providers) < 4:
-            providers.append(fillers[filler_index_less % 2])
-            filler_index_less += 1
-        print(f"DEBUG: After padding to 4: {providers}")
-    elif 5 <= len(providers) < 8:
-        filler_index = 0
-        while len(providers) < 8:
-            providers.append(fillers[filler_index % 2])
-            filler_index += 1
-        print(f"DEBUG: After padding to 8: {providers}")
-    elif len(providers) > 8:
+    # Sampling already randomises the order, so only shuffle when keeping all.
+    if len(providers) > 8:
         providers = random.sample(providers, 8)
-        print(f"DEBUG: After sampling to 8: {providers}")
+        logger.debug("After sampling to 8: %s", providers)
+    else:
+        random.shuffle(providers)
+        logger.debug("After shuffle: %s", providers)
+
+        # Pad up to the 2x2 or 3x3 grid size with alternating fillers.
+        target = 4 if len(providers) <= 4 else 8
+        pad = target - len(providers)
+        if pad:
+            providers.extend((_FILLERS * ((pad + 1) // 2))[:pad])
+            logger.debug("After padding to %d: %s", target, providers)
 
-    print(f"DEBUG: Final result: {providers}, length: {len(providers)}")
+    logger.debug("Final result: %s, length: %d", providers, len(providers))
     return providers
@@ -9,6 +9,9 @@ import sys
 from contextlib import nullcontext
 from typing import Any
 
+# Characters that make shlex do more than split on whitespace.
+_SHLEX_SPECIAL = frozenset("\"'\\")
+
 
 def execute_command(winner: str, app: Any) -> None:
     """Execute the winner as a command and exit the app.
@@ -17,21 +20,28 @@ def execute_command(winner: str, app: Any) -> None:
         winner: The command to execute
         app: The Textual app instance (for suspend and exit)
 
-    - Parses the winner string with shlex to support simple arguments.
+    - Splits the winner string on whitespace, falling back to shlex only
+      when it contains a quote or a backslash.
     - If command is not on PATH, exits with code 127.
-    - On success, replaces the current process using os.execvp.
+    - On success, replaces the current process using os.execv with the
+      path already resolved by shutil.which, so PATH is only searched once.
     """
     # if is code or cursor, automatically add '.' argument
     if winner in ("code", "cursor"):
         winner = f"{winner} ."
 
-    argv = shlex.split(winner)
+    # Winners are almost always bare names, so skip the lexer unless quoting is used.
+    if _SHLEX_SPECIAL.isdisjoint(winner):
+        argv = winner.split()
+    else:
+        argv = shlex.split(winner)
     if not argv:
         app.exit(0)
         return
 
     cmd = argv[0]
-    if shutil.which(cmd) is None:
+    cmd_path = shutil.which(cmd)
+    if cmd_path is None:
         print(f"[rogvibe] Command not found: {cmd}")
         app.exit(127)
         return
@@ -41,7 +51,7 @@ def execute_command(winner: str, app: Any) -> None:
     ctx = app.suspend() if hasattr(app, "suspend") else nullcontext()
     try:
         with ctx:
-            os.execvp(cmd, argv)
+            os.execv(cmd_path, argv)
     except FileNotFoundError:
         print(f"[rogvibe] Command not found: {cmd}", file=sys.stderr)
         app.exit(127)
@@ -4,10 +4,11 @@ from __future__ import annotations
 
 from textual.app import ComposeResult
 from textual.containers import Grid
-from textual.message import Message
 from textual.widget import Widget
 from textual.widgets import Static
 
+from ..models.messages import OriginMessage
+
 
 class Card(Static):
     """A single card widget."""
@@ -60,22 +61,13 @@ class Card(Static):
             self.post_message(CardClicked(self, self))
 
 
-class CardClicked(Message):
+class CardClicked(OriginMessage):
     """Message sent when a card is clicked."""
 
     def __init__(self, sender: Widget, card: Card) -> None:
-        try:
-            super().__init__(sender)  # type: ignore[arg-type]
-        except TypeError:
-            super().__init__()
-        self._origin = sender
+        super().__init__(sender)
         self.card = card
 
-    @property
-    def origin(self) -> Widget:
-        """Widget that emitted the message."""
-        return self._origin
-
 
 class FlipCardGrid(Grid):
     """A 4x4 grid of flip cards."""
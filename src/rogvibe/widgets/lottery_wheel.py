@@ -3,19 +3,30 @@
 from __future__ import annotations
 
 import random
+from functools import lru_cache
 from typing import Any, Sequence
 
 from rich import box
-from rich.align import Align
 from rich.panel import Panel
-from rich.table import Table
 from rich.text import Text
+from textual.app import ComposeResult
+from textual.containers import Grid
 from textual.reactive import reactive
 from textual.widget import Widget
+from textual.widgets import Static
 
-from ..constants import DICE_EMOJI, DICE_FACES, TARGET_EMOJI
+from ..constants import (
+    DICE_EMOJI,
+    DICE_FACES,
+    SPIN_FRAME_INTERVAL,
+    TARGET_EMOJI,
+    frames_for_delay,
+)
 from ..models.messages import SpinFinished, SpinTick
 
+# Only six distinct spinning messages exist, so build them once.
+_SPINNING_TEXT: tuple[str, ...] = tuple(f"{face} Spinning..." for face in DICE_FACES)
+
 
 class LotteryWheel(Widget):
     """Simple wheel that highlights one participant at a time.
@@ -29,12 +40,29 @@ class LotteryWheel(Widget):
     LotteryWheel {
         width: 50;
         height: auto;
+        border: round ansi_bright_cyan;
+        border-title-align: center;
+        border-title-color: ansi_bright_cyan;
+        padding: 0 1;
+        align-horizontal: center;
+    }
+
+    LotteryWheel > Grid {
+        grid-gutter: 0 2;
+        grid-rows: 3;
+    }
+
+    LotteryWheel Static {
+        height: 3;
     }
     """
 
-    current_index = reactive(0)
-    current_dice = reactive("🎯")
-    celebration_border_color = reactive("yellow")  # For flashing animation
+    # Each cell is its own widget, so the wheel itself never needs repainting;
+    # the watchers below update only the cells that changed.
+    current_index = reactive(0, repaint=False, init=False)
+    current_dice = reactive("🎯", repaint=False, init=False)
+    # For flashing animation
+    celebration_border_color = reactive("yellow", repaint=False, init=False)
 
     def __init__(self, participants: Sequence[str]) -> None:
         if not participants or len(participants) < 4:
@@ -47,80 +75,116 @@ class LotteryWheel(Widget):
         self._capacity = 4 if self._grid_size == 2 else 8
         self._cell_width = 12 if self._grid_size == 2 else 14
 
-        limited = list(participants[: self._capacity])
-        self._participants = limited
+        self._participants: tuple[str, ...] = tuple(participants[: self._capacity])
         self._participant_count = len(self._participants)
         extra = len(participants) - len(self._participants)
         self._truncated = extra > 0
-        if self._truncated:
-            self._extra_count = extra
+        self._extra_count = extra if self._truncated else 0
         # Slot indices around the perimeter in clockwise order
-        self._layout_slots: list[int | None] = [
+        self._layout_slots: tuple[int | None, ...] = tuple(
             idx if idx < self._participant_count else None
             for idx in range(self._capacity)
-        ]
+        )
+        # When set, dice faces are written here directly instead of posting SpinTick
+        self.result_static: Static | None = None
         self._is_spinning = False
         self._steps_remaining = 0
         self._initial_steps = 0
-        self._delay = 0.08
-        self._timer: Any | None = None
+        self._frames_to_skip = 0
+        # Dice faces are handled as small integer indices into DICE_FACES
+        self._face_script = b""
+        self._dice_index = -1
+        self._skip_script: tuple[int, ...] = ()
+        self._interval: Any | None = None
         self._dice_faces = DICE_FACES
         self._emoji_dice = DICE_EMOJI
+        # Every empty slot looks the same, so they all share one panel
+        self._empty_cell = Panel(
+            "",
+            box=box.SQUARE,
+            width=self._cell_width,
+            padding=(0, 1),
+            border_style="dim",
+        )
+        # Plain cells never change, so build them once and index by slot. The
+        # highlighted look also depends on the celebration border colour, so
+        # those panels are memoized per (slot, border) instead.
+        self._plain_cells: tuple[Panel, ...] = tuple(
+            self._build_cell(slot_index, False, "dark_cyan")
+            for slot_index in range(self._capacity)
+        )
+        self._highlighted_cell = lru_cache(maxsize=64)(self._build_cell)
+        self._bullseye_cache: Panel | None = None
+        self._bullseye_face: str | None = None
+        self._cells = tuple(
+            Static(self._render_cell(slot_index))
+            for slot_index in range(self._capacity)
+        )
+        # Only the 3x3 layout has a bullseye in the middle
+        self._bullseye_cell = Static(self._bullseye()) if self._grid_size == 3 else None
+        self.border_title = "Rogvibe"
 
     def on_mount(self) -> None:
         """Adjust width for nicer layout depending on grid size."""
         # Narrower width for 2x2 so it doesn't look sparse
         self.styles.width = 36 if self._grid_size == 2 else 50
 
-    def render(self) -> Panel:
-        """Render participants in a faux wheel layout."""
-        table = Table.grid(expand=False, padding=(0, 2))
-
-        if self._grid_size == 2:
-            # 2x2 grid: slots arranged clockwise
-            table.add_row(self._render_cell(0), self._render_cell(1))
-            table.add_row(self._render_cell(3), self._render_cell(2))
-        else:
-            # 3x3 grid: perimeter slots with bullseye center
-            table.add_row(
-                self._render_cell(0), self._render_cell(1), self._render_cell(2)
-            )
-            table.add_row(
-                self._render_cell(7),
-                Panel(
-                    Text(self.current_dice, justify="center"),
-                    box=box.MINIMAL,
-                    padding=(0, 2),
-                ),
-                self._render_cell(3),
-            )
-            table.add_row(
-                self._render_cell(6), self._render_cell(5), self._render_cell(4)
-            )
+    def compose(self) -> ComposeResult:
+        """Lay participants out in a faux wheel, one widget per cell."""
+        size = self._grid_size
+        grid = Grid()
+        grid.styles.grid_size_columns = size
+        grid.styles.grid_columns = str(self._cell_width)
+        grid.styles.width = size * self._cell_width + (size - 1) * 2
+        grid.styles.height = size * 3
+        cells = self._cells
+        with grid:
+            if size == 2:
+                # 2x2 grid: slots arranged clockwise
+                yield from (cells[0], cells[1], cells[3], cells[2])
+            else:
+                # 3x3 grid: perimeter slots with bullseye center
+                yield from (cells[0], cells[1], cells[2])
+                yield from (cells[7], self._bullseye_cell, cells[3])  # type: ignore[misc]
+                yield from (cells[6], cells[5], cells[4])
 
-        return Panel(
-            Align.center(table),
-            title="Rogvibe",
-            border_style="bright_cyan",
-            box=box.ROUNDED,
-        )
+    def watch_current_index(self, old_index: int, new_index: int) -> None:
+        """Restyle only the previously and newly highlighted cells."""
+        self._cells[old_index].update(self._render_cell(old_index))
+        self._cells[new_index].update(self._render_cell(new_index))
+
+    def watch_current_dice(self) -> None:
+        if self._bullseye_cell is not None:
+            self._bullseye_cell.update(self._bullseye())
+
+    def watch_celebration_border_color(self) -> None:
+        index = self.current_index
+        self._cells[index].update(self._render_cell(index))
+
+    def _bullseye(self) -> Panel:
+        """Center dice panel, rebuilt only when the dice face changes."""
+        if self._bullseye_cache is None or self._bullseye_face != self.current_dice:
+            self._bullseye_cache = Panel(
+                Text(self.current_dice, justify="center"),
+                box=box.MINIMAL,
+                padding=(0, 2),
+            )
+            self._bullseye_face = self.current_dice
+        return self._bullseye_cache
 
     def _render_cell(self, slot_index: int) -> Panel:
+        if self._layout_slots[slot_index] != self.current_index:
+            return self._plain_cells[slot_index]
+        # Use celebration_border_color for highlighted cell
+        return self._highlighted_cell(slot_index, True, self.celebration_border_color)
+
+    def _build_cell(self, slot_index: int, highlight: bool, border: str) -> Panel:
         participant_index = self._layout_slots[slot_index]
         if participant_index is None:
-            return Panel(
-                "",
-                box=box.SQUARE,
-                width=self._cell_width,
-                padding=(0, 1),
-                border_style="dim",
-            )
+            return self._empty_cell
 
         participant = self._participants[participant_index]
         label = Text(participant, justify="center", overflow="ellipsis")
-        highlight = participant_index == self.current_index
-        # Use celebration_border_color for highlighted cell
-        border = self.celebration_border_color if highlight else "dark_cyan"
         style = "black on yellow" if highlight else "white on dark_blue"
         label.stylize(style)
         return Panel(
@@ -143,29 +207,53 @@ class LotteryWheel(Widget):
         target_index = random.randrange(self._participant_count)
         offset = (target_index - self.current_index) % self._participant_count
         self._steps_remaining = self._initial_steps + offset
-        self._delay = 0.05
-        self._schedule_tick()
+        # Precompute the whole spin up front so each step only indexes into scripts.
+        # Both scripts are indexed by the steps remaining after a step is taken.
+        self._face_script = bytes(
+            random.choices(range(len(self._dice_faces)), k=self._steps_remaining)
+        )
+        self._dice_index = -1
+        self._skip_script = tuple(
+            frames_for_delay(0.05 + (1 - remaining / self._initial_steps) ** 2 * 0.25)
+            for remaining in range(self._steps_remaining)
+        )
+        self._frames_to_skip = frames_for_delay(0.05)
+        # One fixed-rate interval drives the whole spin instead of a new timer per step.
+        self._interval = self.set_interval(SPIN_FRAME_INTERVAL, self._advance)
 
-    def _schedule_tick(self) -> None:
-        self._timer = self.set_timer(self._delay, self._advance)
+    def _stop_interval(self) -> None:
+        if self._interval is not None:
+            self._interval.stop()
+            self._interval = None
 
     def _advance(self) -> None:
+        # Ease out by idling more frames between steps as the spin slows down.
+        if self._frames_to_skip > 0:
+            self._frames_to_skip -= 1
+            return
+
         self.current_index = (self.current_index + 1) % self._participant_count
         self._steps_remaining -= 1
-        dice_face = random.choice(self._dice_faces)
-        self.current_dice = dice_face
-        self.post_message(SpinTick(self, dice_face))
+        dice_index = self._face_script[self._steps_remaining]
+        # Repeated faces change nothing on screen, so don't notify listeners.
+        if dice_index != self._dice_index:
+            self._dice_index = dice_index
+            dice_face = self._dice_faces[dice_index]
+            self.current_dice = dice_face
+            if self.result_static is None:
+                self.post_message(SpinTick(self, dice_face))
+            elif self._steps_remaining > 0:
+                self.result_static.update(_SPINNING_TEXT[dice_index])
 
         if self._steps_remaining <= 0:
+            self._stop_interval()
             self._is_spinning = False
             self.current_dice = TARGET_EMOJI
             winner = self._participants[self.current_index]
             self.post_message(SpinFinished(self, winner))
             return
 
-        progress = 1 - self._steps_remaining / self._initial_steps
-        self._delay = 0.05 + progress * progress * 0.25
-        self._schedule_tick()
+        self._frames_to_skip = self._skip_script[self._steps_remaining]
 
     @property
     def is_spinning(self) -> bool:
@@ -177,7 +265,7 @@ class LotteryWheel(Widget):
 
     @property
     def extra_count(self) -> int:
-        return getattr(self, "_extra_count", 0)
+        return self._extra_count
 
     @property
     def visible_capacity(self) -> int:
@@ -3,7 +3,7 @@
 from __future__ import annotations
 
 import random
-from typing import Any
+from typing import Any, Sequence
 
 from rich.text import Text
 from textual.app import ComposeResult
@@ -13,7 +13,7 @@ from textual.widget import Widget
 
 from ..models.messages import SlotAllStopped, SlotReelSpinning, SlotReelStopped
 from ..utils.detector import detect_default_participants
-from ..constants import MAYBE_VIBER
+from ..constants import MAYBE_VIBER, SPIN_FRAME_INTERVAL, frames_for_delay
 
 
 class SlotMachineReel(Widget):
@@ -32,14 +32,20 @@ class SlotMachineReel(Widget):
     current_value = reactive("")
     current_index = reactive(0)
 
-    def __init__(self, reel_index: int, items: list[str]) -> None:
+    def __init__(self, reel_index: int, items: Sequence[str]) -> None:
         super().__init__()
         self._reel_index = reel_index
-        self._items = items
+        self._items = tuple(items)
         self._is_spinning = False
-        self._timer: Any | None = None
+        self._interval: Any | None = None
         self._target_value: str | None = None
         self._spin_count = 0
+        self._frames_to_skip = 0
+        self._skip_script: tuple[int, ...] = ()
+        # Items are fixed, so there is one possible rendering per index
+        self._texts = tuple(
+            self._build_text(index) for index in range(len(self._items))
+        )
         self.current_index = random.randrange(len(self._items)) if self._items else 0
         self.current_value = self._items[self.current_index] if self._items else "?"
 
@@ -47,12 +53,15 @@ class SlotMachineReel(Widget):
         """Render the reel with scrolling effect showing 3 items."""
         if not self._items:
             return Text("???", justify="center", style="bold yellow")
+        return self._texts[self.current_index]
 
+    def _build_text(self, index: int) -> Text:
+        """Build the styled text shown when ``index`` is the current item."""
         # Show 3 items: 1 before, current, 1 after
         indices = [
-            (self.current_index - 1) % len(self._items),
-            self.current_index,
-            (self.current_index + 1) % len(self._items),
+            (index - 1) % len(self._items),
+            index,
+            (index + 1) % len(self._items),
         ]
 
         items = [self._items[i] for i in indices]
@@ -98,17 +107,22 @@ class SlotMachineReel(Widget):
         self._target_index = random.randrange(len(self._items))
         self._target_value = self._items[self._target_index]
         self._total_steps = duration_steps
-        self._initial_delay = 0.03  # Start fast
-        self._schedule_spin()
-
-    def _schedule_spin(self) -> None:
-        # Calculate dynamic delay - start fast, end slow
-        progress = self._spin_count / self._total_steps
+        # Precompute the delay schedule - start fast, end slow
         # Use quadratic easing for smooth deceleration
-        delay = self._initial_delay + (progress**2) * 0.15
-        self._timer = self.set_timer(delay, self._advance_spin)
+        initial_delay = 0.03
+        self._skip_script = tuple(
+            frames_for_delay(initial_delay + (step / duration_steps) ** 2 * 0.15)
+            for step in range(duration_steps)
+        )
+        self._frames_to_skip = self._skip_script[0]
+        # Step on the same frame clock as LotteryWheel, skipping frames to ease out
+        self._interval = self.set_interval(SPIN_FRAME_INTERVAL, self._advance_spin)
 
     def _advance_spin(self) -> None:
+        if self._frames_to_skip > 0:
+            self._frames_to_skip -= 1
+            return
+
         self._spin_count += 1
         # Advance to next index for scrolling effect
         self.current_index = (self.current_index + 1) % len(self._items)
@@ -116,6 +130,8 @@ class SlotMachineReel(Widget):
         self.post_message(SlotReelSpinning(self, self._reel_index, self.current_value))
 
         if self._spin_count >= self._total_steps:
+            self._interval.stop()
+            self._interval = None
             self._is_spinning = False
             # Set to target index
             self.current_index = self._target_index
@@ -124,7 +140,7 @@ class SlotMachineReel(Widget):
                 SlotReelStopped(self, self._reel_index, self.current_value)
             )
         else:
-            self._schedule_spin()
+            self._frames_to_skip = self._skip_script[self._spin_count]
 
     @property
     def is_spinning(self) -> bool:
@@ -185,7 +201,7 @@ class SlotMachineWidget(Widget):
         super().__init__()
         # Use detected providers, fallback to MAYBE_VIBER if none found
         detected_providers = detect_default_participants()
-        self._items = detected_providers if detected_providers else list(MAYBE_VIBER)
+        self._items = tuple(detected_providers) if detected_providers else MAYBE_VIBER
         self._reels = [
             SlotMachineReel(0, self._items),
             SlotMachineReel(1, self._items),
@@ -1,84 +1,82 @@
 """Tests for rogvibe.app module."""
 
-from unittest.mock import Mock, patch
+import pytest
+from unittest.mock import patch
+import rogvibe
+import rogvibe.app as rogvibe_app
 from rogvibe.app import run, run_slot_machine, run_flip_card, DEFAULT_PARTICIPANTS
+from rogvibe.constants import FALLBACK_DEFAULTS
 
 
 class TestApp:
     """Test cases for app module functions."""
 
-    def test_run_with_none_participants(self):
+    @pytest.fixture
+    def mock_lottery_app(self):
+        """Patch LotteryApp on the already imported rogvibe.app module."""
+        with patch.object(rogvibe_app, "LotteryApp") as mock_lottery_app:
+            yield mock_lottery_app
+
+    @pytest.fixture
+    def mock_slot_app(self):
+        """Patch SlotMachineApp on the already imported rogvibe.app module."""
+        with patch.object(rogvibe_app, "SlotMachineApp") as mock_slot_app:
+            yield mock_slot_app
+
+    @pytest.fixture
+    def mock_flip_app(self):
+        """Patch FlipCardApp on the already imported rogvibe.app module."""
+        with patch.object(rogvibe_app, "FlipCardApp") as mock_flip_app:
+            yield mock_flip_app
+
+    def test_run_with_none_participants(self, mock_lottery_app):
         """Test run function with None participants."""
-        with patch("rogvibe.app.LotteryApp") as mock_lottery_app:
-            mock_instance = Mock()
-            mock_lottery_app.return_value = mock_instance
+        run(None)
 
-            run(None)
+        # Should use DEFAULT_PARTICIPANTS
+        mock_lottery_app.assert_called_once_with(list(DEFAULT_PARTICIPANTS))
+        mock_lottery_app.return_value.run.assert_called_once()
 
-            # Should use DEFAULT_PARTICIPANTS
-            mock_lottery_app.assert_called_once_with(list(DEFAULT_PARTICIPANTS))
-            mock_instance.run.assert_called_once()
-
-    def test_run_with_empty_participants(self):
+    def test_run_with_empty_participants(self, mock_lottery_app):
         """Test run function with empty participants."""
-        with patch("rogvibe.app.LotteryApp") as mock_lottery_app:
-            mock_instance = Mock()
-            mock_lottery_app.return_value = mock_instance
-
-            run([])
+        run([])
 
-            # Should use DEFAULT_PARTICIPANTS
-            mock_lottery_app.assert_called_once_with(list(DEFAULT_PARTICIPANTS))
-            mock_instance.run.assert_called_once()
+        # Should use DEFAULT_PARTICIPANTS
+        mock_lottery_app.assert_called_once_with(list(DEFAULT_PARTICIPANTS))
+        mock_lottery_app.return_value.run.assert_called_once()
 
-    def test_run_with_valid_participants(self):
+    def test_run_with_valid_participants(self, mock_lottery_app):
         """Test run function with valid participants."""
         participants = ["user1", "user2", "user3", "user4"]
 
-        with patch("rogvibe.app.LotteryApp") as mock_lottery_app:
-            mock_instance = Mock()
-            mock_lottery_app.return_value = mock_instance
-
-            run(participants)
+        run(participants)
 
-            mock_lottery_app.assert_called_once_with(participants)
-            mock_instance.run.assert_called_once()
+        mock_lottery_app.assert_called_once_with(participants)
+        mock_lottery_app.return_value.run.assert_called_once()
 
-    def test_run_with_whitespace_participants(self):
+    def test_run_with_whitespace_participants(self, mock_lottery_app):
         """Test run function with participants containing whitespace."""
         participants = ["  user1  ", "", "  user2  ", "   "]
         expected = ["user1", "user2"]
 
-        with patch("rogvibe.app.LotteryApp") as mock_lottery_app:
-            mock_instance = Mock()
-            mock_lottery_app.return_value = mock_instance
+        run(participants)
 
-            run(participants)
+        mock_lottery_app.assert_called_once_with(expected)
+        mock_lottery_app.return_value.run.assert_called_once()
 
-            mock_lottery_app.assert_called_once_with(expected)
-            mock_instance.run.assert_called_once()
-
-    def test_run_slot_machine(self):
+    def test_run_slot_machine(self, mock_slot_app):
         """Test run_slot_machine function."""
-        with patch("rogvibe.app.SlotMachineApp") as mock_slot_app:
-            mock_instance = Mock()
-            mock_slot_app.return_value = mock_instance
-
-            run_slot_machine()
+        run_slot_machine()
 
-            mock_slot_app.assert_called_once()
-            mock_instance.run.assert_called_once()
+        mock_slot_app.assert_called_once()
+        mock_slot_app.return_value.run.assert_called_once()
 
-    def test_run_flip_card(self):
+    def test_run_flip_card(self, mock_flip_app):
         """Test run_flip_card function."""
-        with patch("rogvibe.app.FlipCardApp") as mock_flip_app:
-            mock_instance = Mock()
-            mock_flip_app.return_value = mock_instance
-
-            run_flip_card()
+        run_flip_card()
 
-            mock_flip_app.assert_called_once()
-            mock_instance.run.assert_called_once()
+        mock_flip_app.assert_called_once()
+        mock_flip_app.return_value.run.assert_called_once()
 
     def test_default_participants_import(self):
         """Test that DEFAULT_PARTICIPANTS is properly imported."""
@@ -90,37 +88,38 @@ class TestApp:
         """Test DEFAULT_PARTICIPANTS when detection returns values."""
         # Use actual provider names from MAYBE_VIBER
         detected_providers = ["kimi", "claude", "gemini", "codex"]
-        # Mock shutil.which to detect specific providers
-        with patch("rogvibe.utils.detector.shutil.which") as mock_which:
+        # Mock the PATH scan to detect specific providers
+        with patch("rogvibe.utils.detector._path_executables") as mock_scan:
+            mock_scan.return_value = set(detected_providers)
 
-            def which_side_effect(cmd):
-                return "/usr/bin/" + cmd if cmd in detected_providers else None
-
-            mock_which.side_effect = which_side_effect
-
-            # Re-import to trigger the detection logic
-            import importlib
-            import rogvibe.app
-
-            importlib.reload(rogvibe.app)
+            participants = rogvibe_app._compute_default_participants()
 
             # Should use detected participants (4 detected, so exactly 4 returned)
-            assert len(rogvibe.app.DEFAULT_PARTICIPANTS) == 4
+            assert len(participants) == 4
             for provider in detected_providers:
-                assert provider in rogvibe.app.DEFAULT_PARTICIPANTS
+                assert provider in participants
 
     def test_default_participants_fallback(self):
         """Test DEFAULT_PARTICIPANTS when detection returns empty."""
-        # Mock shutil.which to detect no providers
-        with patch("rogvibe.utils.detector.shutil.which") as mock_which:
-            mock_which.return_value = None
-
-            # Re-import to trigger the detection logic
-            import importlib
-            import rogvibe.app
-            from rogvibe.constants import FALLBACK_DEFAULTS
-
-            importlib.reload(rogvibe.app)
+        # Mock the PATH scan to detect no providers
+        with patch("rogvibe.utils.detector._path_executables") as mock_scan:
+            mock_scan.return_value = set()
 
             # Should fall back to FALLBACK_DEFAULTS
-            assert rogvibe.app.DEFAULT_PARTICIPANTS == list(FALLBACK_DEFAULTS)
+            assert rogvibe_app._compute_default_participants() == list(
+                FALLBACK_DEFAULTS
+            )
+
+    def test_default_participants_detected_lazily(self, monkeypatch):
+        """Test that default participants are detected on first use and cached."""
+        monkeypatch.setattr(rogvibe_app, "_default_participants", None)
+        with patch("rogvibe.utils.detector._path_executables") as mock_scan:
+            mock_scan.return_value = set()
+
+            assert "DEFAULT_PARTICIPANTS" not in vars(rogvibe_app)
+            mock_scan.assert_not_called()
+            assert rogvibe_app.get_default_participants() is (
+                rogvibe_app.DEFAULT_PARTICIPANTS
+            )
+            assert rogvibe.DEFAULT_PARTICIPANTS is rogvibe_app.DEFAULT_PARTICIPANTS
+            mock_scan.assert_called_once()
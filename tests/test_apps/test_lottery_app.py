@@ -0,0 +1,52 @@
+"""Pilot tests for the lottery application."""
+
+import asyncio
+
+from rich.panel import Panel
+
+from rogvibe.apps.lottery_app import LotteryApp
+from rogvibe.constants import TARGET_EMOJI
+
+PARTICIPANTS = ["a", "b", "c", "d", "e", "f", "g", "h"]
+
+
+def test_spin_lands_on_winner(monkeypatch):
+    """A full spin highlights the winner, shows the target and stops the timer."""
+    monkeypatch.setattr("rogvibe.widgets.lottery_wheel.SPIN_FRAME_INTERVAL", 0.005)
+    monkeypatch.setattr("rogvibe.widgets.lottery_wheel.frames_for_delay", lambda _: 1)
+
+    winners = []
+    on_spin_finished = LotteryApp.on_spin_finished
+
+    def record(self, message):
+        winners.append(message.winner)
+        on_spin_finished(self, message)
+
+    monkeypatch.setattr(LotteryApp, "on_spin_finished", record)
+
+    async def scenario():
+        app = LotteryApp(PARTICIPANTS)
+        async with app.run_test() as pilot:
+            wheel = app._wheel
+            await pilot.press("space")
+            while wheel.is_spinning:
+                await pilot.pause(0.01)
+            await pilot.pause()
+
+            assert len(winners) == 1
+            slot = wheel._layout_slots.index(wheel.current_index)
+            highlighted = wheel._cells[slot].content
+            assert isinstance(highlighted, Panel)
+            assert highlighted.renderable.plain == winners[0]
+            assert highlighted is not wheel._plain_cells[slot]
+            assert all(
+                cell.content is wheel._plain_cells[other]
+                for other, cell in enumerate(wheel._cells)
+                if other != slot and wheel._layout_slots[other] is not None
+            )
+
+            assert wheel.current_dice == TARGET_EMOJI
+            assert wheel._bullseye_cell.content.renderable.plain == TARGET_EMOJI
+            assert wheel._interval is None
+
+    asyncio.run(scenario())
@@ -9,7 +9,7 @@ class TestConfig:
         from rogvibe.config import MAYBE_VIBER
 
         assert MAYBE_VIBER is not None
-        assert isinstance(MAYBE_VIBER, list)
+        assert isinstance(MAYBE_VIBER, tuple)
         assert len(MAYBE_VIBER) > 0
 
     def test_config_exports(self):
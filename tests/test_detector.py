@@ -1,222 +1,191 @@
 """Tests for rogvibe.utils.detector module."""
 
-from unittest.mock import patch
-from rogvibe.utils.detector import detect_default_participants
+import os
+import pytest
+from rogvibe.utils import detector
+from rogvibe.utils.detector import _path_executables, detect_default_participants
 
+# Provider names in MAYBE_VIBER order, shared by the scenarios below
+_TWO = ("kimi", "claude")
+_FOUR = _TWO + ("gemini", "codex")
+_SIX = _FOUR + ("code", "cursor")
+_EIGHT = _SIX + ("amp", "opencode")
+_TEN = _EIGHT + ("extra1", "extra2")
 
-class TestDetector:
-    """Test cases for detector module."""
-
-    def test_detect_default_participants_no_providers(self):
-        """Test when no providers are detected."""
-        with patch("rogvibe.utils.detector.shutil.which") as mock_which:
-            mock_which.return_value = None
-
-            result = detect_default_participants()
-
-            assert result == []
-            # Should be called for each provider in MAYBE_VIBER
-            assert mock_which.call_count > 0
-
-    def test_detect_default_participants_less_than_4(self):
-        """Test when less than 4 providers are detected."""
-        with patch("rogvibe.utils.detector.shutil.which") as mock_which:
-            # Return True for first 2 providers, False for others
-            def which_side_effect(cmd):
-                return "/usr/bin/" + cmd if cmd in ["kimi", "claude"] else None
-
-            mock_which.side_effect = which_side_effect
-
-            result = detect_default_participants()
 
-            assert len(result) == 4
-            assert "kimi" in result
-            assert "claude" in result
-            # Should have filler elements
-            assert "lucky" in result or "handy" in result
+def _executable(path):
+    """Create an empty file at ``path`` with the execute bits set."""
+    path.touch()
+    path.chmod(0o755)
 
-    def test_detect_default_participants_between_5_and_8(self):
-        """Test when between 5 and 8 providers are detected."""
-        with patch("rogvibe.utils.detector.shutil.which") as mock_which:
-            # Return True for first 6 providers, False for others
-            providers = ["kimi", "claude", "gemini", "codex", "code", "cursor"]
 
-            def which_side_effect(cmd):
-                return "/usr/bin/" + cmd if cmd in providers else None
+def _on_path(names):
+    """Return a fake PATH scan that finds exactly ``names``."""
+    found = frozenset(names)
+    return lambda: found
 
-            mock_which.side_effect = which_side_effect
 
-            result = detect_default_participants()
-
-            assert len(result) == 8
-            # All detected providers should be in result
-            for provider in providers:
-                assert provider in result
-            # Should have filler elements
-            assert "lucky" in result or "handy" in result
+class TestDetector:
+    """Test cases for detector module."""
 
-    def test_detect_default_participants_more_than_8(self):
-        """Test when more than 8 providers are detected."""
+    @pytest.mark.parametrize(
+        ("detected", "expected_len"),
+        [
+            pytest.param((), 0, id="no_providers"),
+            pytest.param(_TWO, 4, id="less_than_4"),
+            pytest.param(_FOUR, 4, id="exactly_4"),
+            pytest.param(_SIX, 8, id="between_5_and_8"),
+            pytest.param(_EIGHT, 8, id="exactly_8"),
+        ],
+    )
+    def test_detect_default_participants_counts(
+        self, monkeypatch, detected, expected_len
+    ):
+        """Test result size and padding for the supported provider counts."""
+        scans = []
+        found = frozenset(detected)
+        monkeypatch.setattr(
+            detector, "_path_executables", lambda: scans.append(None) or found
+        )
+
+        result = detect_default_participants()
+
+        # PATH should be scanned exactly once
+        assert len(scans) == 1
+        assert len(result) == expected_len
+        # All detected providers should be in result
+        for provider in detected:
+            assert provider in result
+        # Only short lists are padded with filler elements
+        fillers = [name for name in result if name in ("lucky", "handy")]
+        assert len(fillers) == expected_len - len(detected)
+
+    def test_detect_default_participants_more_than_8(self, monkeypatch):
+        """Test that more than 8 providers are narrowed with random.sample."""
         # Patch MAYBE_VIBER to have more than 8 elements
-        extra_providers = [
-            "kimi",
-            "claude",
-            "gemini",
-            "codex",
-            "code",
-            "cursor",
-            "amp",
-            "opencode",
-            "extra1",
-            "extra2",
-        ]
-        with patch("rogvibe.utils.detector.MAYBE_VIBER", extra_providers):
-            with patch("rogvibe.utils.detector.shutil.which") as mock_which:
-                # Return True for all providers (more than 8)
-                mock_which.return_value = "/usr/bin/provider"
-
-                with patch("rogvibe.utils.detector.random.sample") as mock_sample:
-                    mock_sample.return_value = [
-                        "kimi",
-                        "claude",
-                        "gemini",
-                        "codex",
-                        "code",
-                        "cursor",
-                        "amp",
-                        "opencode",
-                    ]
-
-                    result = detect_default_participants()
-
-                    assert len(result) == 8
-                    mock_sample.assert_called_once()
-
-    def test_detect_default_participants_exactly_4(self):
-        """Test when exactly 4 providers are detected."""
-        with patch("rogvibe.utils.detector.shutil.which") as mock_which:
-            # Return True for exactly 4 providers
-            providers = ["kimi", "claude", "gemini", "codex"]
-
-            def which_side_effect(cmd):
-                return "/usr/bin/" + cmd if cmd in providers else None
-
-            mock_which.side_effect = which_side_effect
-
-            result = detect_default_participants()
-
-            assert len(result) == 4
-            # All detected providers should be in result
-            for provider in providers:
-                assert provider in result
-            # Should not have filler elements (exactly 4 is the minimum)
-
-    def test_detect_default_participants_exactly_8(self):
-        """Test when exactly 8 providers are detected."""
-        with patch("rogvibe.utils.detector.shutil.which") as mock_which:
-            # Return True for exactly 8 providers
-            providers = [
-                "kimi",
-                "claude",
-                "gemini",
-                "codex",
-                "code",
-                "cursor",
-                "amp",
-                "opencode",
-            ]
-
-            def which_side_effect(cmd):
-                return "/usr/bin/" + cmd if cmd in providers else None
-
-            mock_which.side_effect = which_side_effect
-
-            result = detect_default_participants()
-
-            assert len(result) == 8
-            # All detected providers should be in result
-            for provider in providers:
-                assert provider in result
-
-    def test_detect_default_participants_shuffling(self):
+        extra_providers = list(_TEN)
+        samples = []
+        monkeypatch.setattr(detector, "MAYBE_VIBER", extra_providers)
+        # All providers are on PATH (more than 8)
+        monkeypatch.setattr(detector, "_path_executables", _on_path(extra_providers))
+        monkeypatch.setattr(
+            detector.random,
+            "sample",
+            lambda population, k: samples.append(k) or list(population)[:k],
+        )
+
+        result = detect_default_participants()
+
+        assert samples == [8]
+        assert len(result) == 8
+        assert set(result) <= set(extra_providers)
+
+    def test_detect_default_participants_shuffling(self, monkeypatch):
         """Test that providers are shuffled."""
-        with patch("rogvibe.utils.detector.shutil.which") as mock_which:
-            # Return True for 4 providers
-            providers = ["kimi", "claude", "gemini", "codex"]
+        shuffles = []
+        monkeypatch.setattr(detector, "_path_executables", _on_path(_FOUR))
+        monkeypatch.setattr(detector.random, "shuffle", shuffles.append)
+
+        result = detect_default_participants()
+
+        assert len(shuffles) == 1
+        assert len(result) == 4
+
+    def test_detect_default_participants_more_than_8_not_shuffled(self, monkeypatch):
+        """Test that sampling replaces the shuffle when more than 8 providers."""
+        extra_providers = [f"provider{i}" for i in range(10)]
+        shuffles = []
+        monkeypatch.setattr(detector, "MAYBE_VIBER", extra_providers)
+        monkeypatch.setattr(detector, "_path_executables", _on_path(extra_providers))
+        monkeypatch.setattr(detector.random, "shuffle", shuffles.append)
+
+        result = detect_default_participants()
+
+        assert shuffles == []
+        assert len(result) == 8
+        assert set(result) <= set(extra_providers)
+
+    def test_path_executables_scans_path(self, tmp_path, monkeypatch):
+        """Test that PATH directories are listed, skipping missing ones and subdirs."""
+        bin_dir = tmp_path / "bin"
+        bin_dir.mkdir()
+        _executable(bin_dir / "kimi")
+        _executable(bin_dir / "claude")
+        (bin_dir / "code").mkdir()
+        missing_dir = tmp_path / "missing"
+        monkeypatch.setenv(
+            "PATH", os.pathsep.join([str(missing_dir), "", str(bin_dir)])
+        )
+
+        assert _path_executables() == {"kimi", "claude"}
+
+    def test_path_executables_skips_unrunnable_entries(self, tmp_path, monkeypatch):
+        """Test that only executable regular files count, like shutil.which."""
+        _executable(tmp_path / "codex")
+        (tmp_path / "claude").touch()  # Not executable
+        (tmp_path / "kimi").symlink_to(tmp_path / "missing")  # Dangling symlink
+        monkeypatch.setenv("PATH", str(tmp_path))
+
+        assert _path_executables() == {"codex"}
+        result = detect_default_participants()
+        assert "claude" not in result
+        assert "kimi" not in result
+
+    def test_path_executables_windows_pathext(self, tmp_path):
+        """Test that PATHEXT suffixes are stripped on Windows."""
+        (tmp_path / "Claude.CMD").touch()
+        (tmp_path / "kimi.exe").touch()
+        (tmp_path / "readme.txt").touch()
+
+        result = detector._scan_path(
+            str(tmp_path),
+            os.pathsep.join([".EXE", ".CMD"]),
+            True,
+            frozenset({"claude", "kimi", "readme"}),
+        )
+
+        assert result == {"claude", "kimi"}
+
+    def test_path_executables_cached_per_path(self, tmp_path, monkeypatch):
+        """Test that a PATH value is only scanned once."""
+        _executable(tmp_path / "kimi")
+        monkeypatch.setenv("PATH", str(tmp_path))
+
+        first = _path_executables()
+        _executable(tmp_path / "claude")
+
+        assert _path_executables() is first
+        assert first == {"kimi"}
+
+    def test_with_custom_maybe_viber(self, monkeypatch):
+        """Test with custom MAYBE_VIBER list."""
+        monkeypatch.setattr(detector, "MAYBE_VIBER", ["test1", "test2", "test3"])
+        monkeypatch.setattr(detector, "_path_executables", _on_path(("test1", "test2")))
 
-            def which_side_effect(cmd):
-                return "/usr/bin/" + cmd if cmd in providers else None
+        result = detect_default_participants()
 
-            mock_which.side_effect = which_side_effect
+        assert len(result) == 4
+        assert "test1" in result
+        assert "test2" in result
+        # Should have fillers
+        assert "lucky" in result or "handy" in result
 
-            with patch("rogvibe.utils.detector.random.shuffle") as mock_shuffle:
-                result = detect_default_participants()
+    def test_duplicate_maybe_viber_entries(self, monkeypatch):
+        """Test that repeated MAYBE_VIBER entries are only detected once."""
+        monkeypatch.setattr(detector, "MAYBE_VIBER", ["kimi", "claude", "kimi", "amp"])
+        monkeypatch.setattr(
+            detector, "_path_executables", _on_path(("kimi", "claude", "amp"))
+        )
 
-                mock_shuffle.assert_called_once()
-                assert len(result) == 4
+        result = detect_default_participants()
 
-    def test_detect_default_participants_random_sample(self):
-        """Test random.sample is called when more than 8 providers."""
-        # Patch MAYBE_VIBER to have more than 8 elements
-        extra_providers = [
-            "kimi",
-            "claude",
-            "gemini",
-            "codex",
-            "code",
-            "cursor",
-            "amp",
-            "opencode",
-            "extra1",
-            "extra2",
-        ]
-        with patch("rogvibe.utils.detector.MAYBE_VIBER", extra_providers):
-            with patch("rogvibe.utils.detector.shutil.which") as mock_which:
-                # Return True for all providers (more than 8)
-                mock_which.return_value = "/usr/bin/provider"
-
-                with patch("rogvibe.utils.detector.random.sample") as mock_sample:
-                    mock_sample.return_value = [
-                        "kimi",
-                        "claude",
-                        "gemini",
-                        "codex",
-                        "code",
-                        "cursor",
-                        "amp",
-                        "opencode",
-                    ]
-
-                    result = detect_default_participants()
-
-                    mock_sample.assert_called_once()
-                    assert len(result) == 8
-
-    def test_internal_on_path_function(self):
-        """Test the internal on_path function."""
-        with patch("rogvibe.utils.detector.shutil.which") as mock_which:
-            mock_which.side_effect = (
-                lambda cmd: "/usr/bin/cmd" if cmd == "test_cmd" else None
-            )
-
-            # Test by calling detect_default_participants and checking behavior
-            detect_default_participants()
-
-            # Verify that shutil.which was called with the expected commands
-            calls = [call[0][0] for call in mock_which.call_args_list]
-            # Should include commands from MAYBE_VIBER
-            assert len(calls) > 0
-
-    @patch("rogvibe.utils.detector.MAYBE_VIBER", ["test1", "test2", "test3"])
-    def test_with_custom_maybe_viber(self):
-        """Test with custom MAYBE_VIBER list."""
-        with patch("rogvibe.utils.detector.shutil.which") as mock_which:
-            mock_which.side_effect = lambda cmd: cmd in ["test1", "test2"]
+        assert len(result) == 4
+        assert result.count("kimi") == 1
+
+    def test_detect_default_participants_is_quiet(self, monkeypatch, capsys):
+        """Test that detection logs instead of printing to the terminal."""
+        monkeypatch.setattr(detector, "_path_executables", _on_path(_TWO))
 
-            result = detect_default_participants()
+        detect_default_participants()
 
-            assert len(result) == 4
-            assert "test1" in result
-            assert "test2" in result
-            # Should have fillers
-            assert "lucky" in result or "handy" in result
+        assert capsys.readouterr().out == ""
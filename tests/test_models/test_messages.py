@@ -1,7 +1,5 @@
 """Tests for rogvibe.models.messages module."""
 
-from unittest.mock import Mock
-from textual.widget import Widget
 from rogvibe.models.messages import (
     SpinFinished,
     SpinTick,
@@ -13,79 +11,83 @@ from rogvibe.models.messages import (
 )
 
 
+class _StubWidget:
+    """Stand-in sender; messages only keep a reference to it."""
+
+
 class TestMessages:
     """Test cases for message classes."""
 
     def test_spin_finished_message(self):
         """Test SpinFinished message creation and properties."""
-        mock_widget = Mock(spec=Widget)
+        widget = _StubWidget()
         winner = "test_winner"
 
-        msg = SpinFinished(mock_widget, winner)
+        msg = SpinFinished(widget, winner)
 
         assert msg.winner == winner
-        assert msg.origin == mock_widget
+        assert msg.origin is widget
 
     def test_spin_tick_message(self):
         """Test SpinTick message creation and properties."""
-        mock_widget = Mock(spec=Widget)
+        widget = _StubWidget()
         dice_face = "⚀"
 
-        msg = SpinTick(mock_widget, dice_face)
+        msg = SpinTick(widget, dice_face)
 
         assert msg.dice_face == dice_face
-        assert msg.origin == mock_widget
+        assert msg.origin is widget
 
     def test_slot_reel_spinning_message(self):
         """Test SlotReelSpinning message creation and properties."""
-        mock_widget = Mock(spec=Widget)
+        widget = _StubWidget()
         reel_index = 0
         value = "test_value"
 
-        msg = SlotReelSpinning(mock_widget, reel_index, value)
+        msg = SlotReelSpinning(widget, reel_index, value)
 
         assert msg.reel_index == reel_index
         assert msg.value == value
-        assert msg.origin == mock_widget
+        assert msg.origin is widget
 
     def test_slot_reel_stopped_message(self):
         """Test SlotReelStopped message creation and properties."""
-        mock_widget = Mock(spec=Widget)
+        widget = _StubWidget()
         reel_index = 2
         value = "stopped_value"
 
-        msg = SlotReelStopped(mock_widget, reel_index, value)
+        msg = SlotReelStopped(widget, reel_index, value)
 
         assert msg.reel_index == reel_index
         assert msg.value == value
-        assert msg.origin == mock_widget
+        assert msg.origin is widget
 
     def test_slot_all_stopped_message(self):
         """Test SlotAllStopped message creation and properties."""
-        mock_widget = Mock(spec=Widget)
+        widget = _StubWidget()
         results = ["val1", "val2", "val3"]
 
-        msg = SlotAllStopped(mock_widget, results)
+        msg = SlotAllStopped(widget, results)
 
         assert msg.results == results
-        assert msg.origin == mock_widget
+        assert msg.origin is widget
 
     def test_all_cards_matched_message(self):
         """Test AllCardsMatched message creation and properties."""
-        mock_widget = Mock(spec=Widget)
+        widget = _StubWidget()
         winner = "card_winner"
 
-        msg = AllCardsMatched(mock_widget, winner)
+        msg = AllCardsMatched(widget, winner)
 
         assert msg.winner == winner
-        assert msg.origin == mock_widget
+        assert msg.origin is widget
 
     def test_pair_matched_message(self):
         """Test PairMatched message creation and properties."""
-        mock_widget = Mock(spec=Widget)
+        widget = _StubWidget()
         value = "pair_value"
 
-        msg = PairMatched(mock_widget, value)
+        msg = PairMatched(widget, value)
 
         assert msg.value == value
-        assert msg.origin == mock_widget
+        assert msg.origin is widget
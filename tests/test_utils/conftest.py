@@ -0,0 +1,19 @@
+"""Pytest fixtures for rogvibe.utils tests."""
+
+from unittest.mock import MagicMock, Mock
+
+import pytest
+
+
+@pytest.fixture
+def mock_app():
+    """Create a mock Textual app whose suspend() works as a context manager."""
+    return MagicMock()
+
+
+@pytest.fixture
+def mock_execv(monkeypatch):
+    """Replace os.execv in the executor module so no test replaces the process."""
+    execv = Mock()
+    monkeypatch.setattr("rogvibe.utils.executor.os.execv", execv)
+    return execv
@@ -1,137 +1,113 @@
 """Tests for rogvibe.utils.executor module."""
 
-from unittest.mock import Mock, patch
+import pytest
+from types import SimpleNamespace
+from unittest.mock import Mock
 from rogvibe.utils.executor import execute_command
 
 
+@pytest.fixture(autouse=True)
+def patched_which(monkeypatch):
+    """Resolve commands from a dict so no test depends on the real PATH."""
+    paths = {}
+    monkeypatch.setattr("rogvibe.utils.executor.shutil.which", paths.get)
+    return paths
+
+
 class TestExecutor:
     """Test cases for executor module."""
 
-    def test_execute_command_with_code(self):
+    def test_execute_command_with_code(self, patched_which, mock_app, mock_execv):
         """Test execute_command with 'code' command adds '.' argument."""
-        mock_app = Mock()
-        mock_app.suspend = Mock(return_value=Mock(__enter__=Mock(), __exit__=Mock()))
+        patched_which["code"] = "/usr/bin/code"
 
-        with patch("rogvibe.utils.executor.shutil.which") as mock_which:
-            mock_which.return_value = "/usr/bin/code"
+        execute_command("code", mock_app)
 
-            with patch("rogvibe.utils.executor.os.execvp") as mock_exec:
-                execute_command("code", mock_app)
+        # Should be called with 'code' and '.'
+        mock_execv.assert_called_once_with("/usr/bin/code", ["code", "."])
+        # The terminal should be handed back before exec
+        mock_app.suspend.return_value.__enter__.assert_called_once()
 
-                # Should be called with 'code' and '.'
-                mock_exec.assert_called_once_with("code", ["code", "."])
-
-    def test_execute_command_with_cursor(self):
+    def test_execute_command_with_cursor(self, patched_which, mock_app, mock_execv):
         """Test execute_command with 'cursor' command adds '.' argument."""
-        mock_app = Mock()
-        mock_app.suspend = Mock(return_value=Mock(__enter__=Mock(), __exit__=Mock()))
-
-        with patch("rogvibe.utils.executor.shutil.which") as mock_which:
-            mock_which.return_value = "/usr/bin/cursor"
+        patched_which["cursor"] = "/usr/bin/cursor"
 
-            with patch("rogvibe.utils.executor.os.execvp") as mock_exec:
-                execute_command("cursor", mock_app)
+        execute_command("cursor", mock_app)
 
-                mock_exec.assert_called_once_with("cursor", ["cursor", "."])
+        mock_execv.assert_called_once_with("/usr/bin/cursor", ["cursor", "."])
 
-    def test_execute_command_with_empty_string(self):
+    def test_execute_command_with_empty_string(self, mock_app):
         """Test execute_command with empty string exits with code 0."""
-        mock_app = Mock()
-
         execute_command("", mock_app)
 
         mock_app.exit.assert_called_once_with(0)
 
-    def test_execute_command_not_found(self):
+    def test_execute_command_not_found(self, mock_app, mock_execv):
         """Test execute_command when command is not on PATH."""
-        mock_app = Mock()
-
-        with patch("rogvibe.utils.executor.shutil.which") as mock_which:
-            mock_which.return_value = None
-
-            execute_command("nonexistent", mock_app)
+        execute_command("nonexistent", mock_app)
 
-            mock_app.exit.assert_called_once_with(127)
+        mock_app.exit.assert_called_once_with(127)
+        mock_execv.assert_not_called()
 
-    def test_execute_command_with_arguments(self):
+    def test_execute_command_with_arguments(self, patched_which, mock_app, mock_execv):
         """Test execute_command with arguments."""
-        mock_app = Mock()
-        mock_app.suspend = Mock(return_value=Mock(__enter__=Mock(), __exit__=Mock()))
+        patched_which["ls"] = "/usr/bin/ls"
 
-        with patch("rogvibe.utils.executor.shutil.which") as mock_which:
-            mock_which.return_value = "/usr/bin/ls"
+        execute_command("ls -la", mock_app)
 
-            with patch("rogvibe.utils.executor.os.execvp") as mock_exec:
-                execute_command("ls -la", mock_app)
+        mock_execv.assert_called_once_with("/usr/bin/ls", ["ls", "-la"])
 
-                mock_exec.assert_called_once_with("ls", ["ls", "-la"])
+    def test_execute_command_with_quoted_arguments(
+        self, patched_which, mock_app, mock_execv
+    ):
+        """Test execute_command keeps quoted arguments together."""
+        patched_which["echo"] = "/usr/bin/echo"
 
-    def test_execute_command_file_not_found_error(self):
-        """Test execute_command when FileNotFoundError is raised."""
-        mock_app = Mock()
-        mock_context = Mock()
-        mock_context.__enter__ = Mock(return_value=None)
-        mock_context.__exit__ = Mock(return_value=None)
-        mock_app.suspend = Mock(return_value=mock_context)
+        execute_command("echo 'hello world'", mock_app)
 
-        with patch("rogvibe.utils.executor.shutil.which") as mock_which:
-            mock_which.return_value = "/usr/bin/cmd"
+        mock_execv.assert_called_once_with("/usr/bin/echo", ["echo", "hello world"])
 
-            with patch("rogvibe.utils.executor.os.execvp") as mock_exec:
-                with patch("rogvibe.utils.executor.print"):
-                    mock_exec.side_effect = FileNotFoundError()
+    def test_execute_command_file_not_found_error(
+        self, patched_which, mock_app, mock_execv, capsys
+    ):
+        """Test execute_command when FileNotFoundError is raised."""
+        patched_which["cmd"] = "/usr/bin/cmd"
+        mock_execv.side_effect = FileNotFoundError()
 
-                    execute_command("cmd", mock_app)
+        execute_command("cmd", mock_app)
 
-                    mock_app.exit.assert_called_once_with(127)
+        mock_app.exit.assert_called_once_with(127)
+        assert "Command not found: cmd" in capsys.readouterr().err
 
-    def test_execute_command_permission_error(self):
+    def test_execute_command_permission_error(
+        self, patched_which, mock_app, mock_execv, capsys
+    ):
         """Test execute_command when PermissionError is raised."""
-        mock_app = Mock()
-        mock_context = Mock()
-        mock_context.__enter__ = Mock(return_value=None)
-        mock_context.__exit__ = Mock(return_value=None)
-        mock_app.suspend = Mock(return_value=mock_context)
-
-        with patch("rogvibe.utils.executor.shutil.which") as mock_which:
-            mock_which.return_value = "/usr/bin/cmd"
-
-            with patch("rogvibe.utils.executor.os.execvp") as mock_exec:
-                with patch("rogvibe.utils.executor.print"):
-                    mock_exec.side_effect = PermissionError()
+        patched_which["cmd"] = "/usr/bin/cmd"
+        mock_execv.side_effect = PermissionError()
 
-                    execute_command("cmd", mock_app)
+        execute_command("cmd", mock_app)
 
-                    mock_app.exit.assert_called_once_with(126)
+        mock_app.exit.assert_called_once_with(126)
+        assert "Permission denied: cmd" in capsys.readouterr().err
 
-    def test_execute_command_os_error(self):
+    def test_execute_command_os_error(
+        self, patched_which, mock_app, mock_execv, capsys
+    ):
         """Test execute_command when OSError is raised."""
-        mock_app = Mock()
-        mock_context = Mock()
-        mock_context.__enter__ = Mock(return_value=None)
-        mock_context.__exit__ = Mock(return_value=None)
-        mock_app.suspend = Mock(return_value=mock_context)
+        patched_which["cmd"] = "/usr/bin/cmd"
+        mock_execv.side_effect = OSError("Some OS error")
 
-        with patch("rogvibe.utils.executor.shutil.which") as mock_which:
-            mock_which.return_value = "/usr/bin/cmd"
+        execute_command("cmd", mock_app)
 
-            with patch("rogvibe.utils.executor.os.execvp") as mock_exec:
-                with patch("rogvibe.utils.executor.print"):
-                    mock_exec.side_effect = OSError("Some OS error")
+        mock_app.exit.assert_called_once_with(1)
+        assert "Failed to exec 'cmd': Some OS error" in capsys.readouterr().err
 
-                    execute_command("cmd", mock_app)
-
-                    mock_app.exit.assert_called_once_with(1)
-
-    def test_execute_command_without_suspend(self):
+    def test_execute_command_without_suspend(self, patched_which, mock_execv):
         """Test execute_command with app that doesn't have suspend method."""
-        mock_app = Mock(spec=[])  # No suspend method
-        delattr(mock_app, "suspend")
-
-        with patch("rogvibe.utils.executor.shutil.which") as mock_which:
-            mock_which.return_value = "/usr/bin/echo"
+        mock_app = SimpleNamespace(exit=Mock())  # No suspend method
+        patched_which["echo"] = "/usr/bin/echo"
 
-            with patch("rogvibe.utils.executor.os.execvp") as mock_exec:
-                execute_command("echo hello", mock_app)
+        execute_command("echo hello", mock_app)
 
-                mock_exec.assert_called_once_with("echo", ["echo", "hello"])
+        mock_execv.assert_called_once_with("/usr/bin/echo", ["echo", "hello"])